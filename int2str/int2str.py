@@ -52,6 +52,7 @@ Copyright 2022 Robert Byers
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 """
 
+import functools
 from enum import Enum, auto
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -113,7 +114,8 @@ class Int2str():
 
 
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    def __int2str_util__(self, n, lang):
+    @staticmethod
+    def __int2str_util__(n, lang):
         """
         Receives an integer from 1 to 999. Returns the words equivalent.
 
@@ -129,6 +131,10 @@ class Int2str():
         scope of the calling method). Therefore, only a minimal bounds
         check is performed here.
 
+        All 1-999 words are precomputed once at import time (see
+        __build_sub1000__ below), so this method reduces to a single
+        table lookup.
+
         Args..
 
             n, An integer in the range 1 <= n <= 999
@@ -147,35 +153,13 @@ class Int2str():
         if n < 1 or n > 999:
             raise ValueError
 
-        # Initialize the return value
-        the_number = ''
-
-        # Process hundredths
-        if n >= 100:
-            num_hundreds = int(n/100)
-            num_hundreds_word = Int2str.LEXICON[lang][num_hundreds]
-            the_number += ' ' + num_hundreds_word + ' ' + Int2str.LEXICON[lang][100]
-            # Remove the hundredths, so we can process the rest of the number
-            n %= 100
-
-        # Process 20, 30, ... 90
-        if n >= 20 and n <= 99:
-            num_tenths = int(n/10)*10
-            num_tenths_word = Int2str.LEXICON[lang][num_tenths]
-            the_number += ' ' + num_tenths_word
-            # Remove the tenths, so we can process the rest of the number
-            n %= 10
-
-        # Process 1 through 19
-        if n >= 1 and n <= 19:
-            the_number += ' ' + Int2str.LEXICON[lang][n]
-
         # That is all
-        return the_number.strip()
+        return _SUB1000[lang][n]
 
 
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    def int2str(self, n, lang=None):
+    @staticmethod
+    def int2str(n, lang=None):
         """
         Accepts an integer and language (optional). Returns the word equivalent.
 
@@ -199,49 +183,179 @@ class Int2str():
         if not lang:
             lang = Int2strLang.ENGLISH
 
-        # Fail if n is not an integer
-        if not isinstance(n, int):
+        # Fail if n is not an integer, or is out of range. An exact type
+        # check is used (rather than isinstance) both because it is faster
+        # and because it rejects booleans, which isinstance lets through.
+        if type(n) is not int or not Int2str.MIN <= n <= Int2str.MAX:
             raise ValueError
 
-        # Fail if n is out of range
-        if n < Int2str.MIN or n > Int2str.MAX:
-            raise ValueError
+        # Dispatch to the language's specialized translator (built once at
+        # import time with all of its words pre-bound, see __specialize__)
+        return _SPECIALIZED[lang](n)
+
+
+# Dense per-language tuples for the 1-19 and 20-90 words, derived from
+# LEXICON. The keys in these ranges are contiguous, so a tuple index
+# replaces the dict hash-and-probe. Unused slots hold None.
+_ONES_TEENS = {
+    lang: (None,) + tuple(Int2str.LEXICON[lang][i] for i in range(1, 20))
+    for lang in Int2strLang
+}
+
+_TENS = {
+    lang: (None, None) + tuple(Int2str.LEXICON[lang][i * 10] for i in range(2, 10))
+    for lang in Int2strLang
+}
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+def __build_sub1000__(n, lang):
+    """
+    Receives an integer from 1 to 999. Builds the words equivalent.
+
+    ==> THIS METHOD IS FOR INTERNAL USE ONLY.
+
+    This is the build step behind the _SUB1000 lookup table. It runs
+    once per entry at import time. All runtime translations are served
+    from the table, never from this method.
+
+    Args..
+
+        n, An integer in the range 1 <= n <= 999
+
+        lang, An Int2strLang enum specifying the language to be used.
+
+    Returns..
+
+        the_number, A string representation of the integer, in
+                    the given language
+    """
+
+    # Hoist the per-language word tables to locals, saving a module/class
+    # lookup on every word added below. The dense 1-19 and 20-90 ranges
+    # are served from tuples; only the 'hundred' scale word needs the dict.
+    ones_teens = _ONES_TEENS[lang]
+    tens = _TENS[lang]
+
+    # Collect the words in a list and join them once at the end. This
+    # avoids re-allocating an ever-growing string for each word added.
+    parts = []
+
+    # Process hundredths
+    if n >= 100:
+        # divmod() peels off the hundredths and leaves the remainder in one step
+        num_hundreds, n = divmod(n, 100)
+        parts.append(ones_teens[num_hundreds])
+        parts.append(Int2str.LEXICON[lang][100])
+
+    # Process 20, 30, ... 90
+    if n >= 20 and n <= 99:
+        # divmod() peels off the tenths and leaves the remainder in one step
+        num_tenths, n = divmod(n, 10)
+        parts.append(tens[num_tenths])
+
+    # Process 1 through 19
+    if n >= 1 and n <= 19:
+        parts.append(ones_teens[n])
+
+    # That is all
+    return ' '.join(parts)
+
+
+# A per-language tuple of all 1-999 words, built once at import time.
+# Index 0 is unused (zero is special-cased in Int2str.int2str).
+_SUB1000 = {
+    lang: ('',) + tuple(__build_sub1000__(n, lang) for n in range(1, 1000))
+    for lang in Int2strLang
+}
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+def __specialize__(lang):
+    """
+    Builds and returns a translator function specialized for one language.
+
+    ==> THIS METHOD IS FOR INTERNAL USE ONLY.
+
+    The decomposition logic is identical for every language - only the
+    words differ. This method binds one language's word tables into a
+    closure so the returned translator performs no lexicon lookups at
+    all; every name it touches is a pre-bound local.
+
+    The returned translator assumes its input has already been
+    validated (see Int2str.int2str).
+
+    Args..
+
+        lang, An Int2strLang enum specifying the language to be used.
+
+    Returns..
+
+        translate, A function accepting a validated integer and
+                   returning its string representation
+    """
+
+    sub1000 = _SUB1000[lang]
+    zero_word = Int2str.LEXICON[lang][0]
+    negative_word = Int2str.LEXICON[lang][-1]
+
+    million_word = Int2str.LEXICON[lang][1000000]
+    thousand_word = Int2str.LEXICON[lang][1000]
+
+    def translate(n):
 
         # Special case: zero
         if n == 0:
-            return 'zero'
+            return zero_word
 
-        # Initialize the return string as 'negative' for negative n, or an empty string for non-negative n
+        # Collect the words in a list and join them once at the end
         if n < 0:
-            the_number = Int2str.LEXICON[lang][-1]
+            parts = [negative_word]
+            n = -n
         else:
-            the_number = ''
-
-        # Ditch the negative sign, we've already processed it
-        n = abs(n)
-
-        # Process millions
-        if n >= 1000000:
-            num_millions = int(n/1000000)
-            num_millions_string = self.__int2str_util__(num_millions, lang)
-            the_number += ' ' + num_millions_string + ' ' + Int2str.LEXICON[lang][1000000]
-            # Remove the millions, so we can process the rest of the number
-            n %= 1000000
-
-        # Process thousandths
-        if n >= 1000:
-            num_thousandths = int(n/1000)
-            num_thousandths_string = self.__int2str_util__(num_thousandths, lang)
-            the_number += ' ' + num_thousandths_string + ' ' + Int2str.LEXICON[lang][1000]
-            # Remove the thousandths, so we can process the rest of the number
-            n %= 1000
+            parts = []
+
+        # Split the number into its digit groups unconditionally - two
+        # predictable divmods cost less than the per-scale compare-and-
+        # branch they replace. Zero groups are simply not emitted below.
+        # Extending the supported range (e.g. to billions) means one more
+        # divmod, one more loop entry and a raised MAX.
+        millions, remainder = divmod(n, 1000000)
+        thousandths, units = divmod(remainder, 1000)
+
+        for group, scale_word in ((millions, million_word), (thousandths, thousand_word)):
+            if group:
+                parts.append(sub1000[group])
+                parts.append(scale_word)
 
         # Process ones, tens and hundreds
-        if n > 0:
-            the_number += ' ' + self.__int2str_util__(n, lang)
+        if units:
+            parts.append(sub1000[units])
 
         # That is all
-        return the_number.strip()
+        return ' '.join(parts)
+
+    return translate
+
+
+# The specialized translators, one per language, built once at import time
+_SPECIALIZED = {lang: __specialize__(lang) for lang in Int2strLang}
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+@functools.lru_cache(maxsize=4096)
+def __int2str_cached__(n, lang):
+    """
+    Memoized worker for the int2str() wrapper below.
+
+    ==> THIS METHOD IS FOR INTERNAL USE ONLY.
+
+    Callers must pass a concrete Int2strLang value (never None) so that
+    equivalent calls always hash to the same cache entry. The wrapper
+    below performs that normalization.
+    """
+
+    return Int2str.int2str(n, lang)
 
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -249,9 +363,10 @@ def int2str(n, lang=None):
     """
     Accepts an integer and language (optional). Returns the word equivalent.
 
-    This is a wrapper method for int2str(). Inside this wrapper we
-    instantiate an Int2str() object and then invoke the class method
-    int2str(), returning its result.
+    This is a wrapper method for int2str(). The language argument is
+    normalized (None becomes ENGLISH), after which the work is delegated
+    to a memoized worker. Repeated calls with the same integer and
+    language are answered directly from the cache.
 
     Args..
 
@@ -266,6 +381,36 @@ def int2str(n, lang=None):
                     the given language
     """
 
-    obj = Int2str()
-    return obj.int2str(n, lang)
+    if not lang:
+        lang = Int2strLang.ENGLISH
+    return __int2str_cached__(n, lang)
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+def int2str_batch(values, lang=None):
+    """
+    Accepts an iterable of integers. Returns a list of word equivalents.
+
+    This is the bulk-conversion entry point. It performs the language
+    normalization once and binds the memoized worker to a local before
+    looping, so per-element overhead is just one call into the cache.
+    Intended for workloads that translate whole columns of integers.
+
+    Args..
+
+        values, An iterable of integers, each in the supported range
+
+        lang, An Int2strLang enum specifying the language to be used.
+              Default: ENGLISH
+
+    Returns..
+
+        A list of string representations, one per input integer, in
+        the given language
+    """
+
+    if not lang:
+        lang = Int2strLang.ENGLISH
+    cached = __int2str_cached__
+    return [cached(n, lang) for n in values]
 
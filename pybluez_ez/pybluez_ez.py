@@ -78,15 +78,34 @@ For information about the linux bluetooth stack, see https://ubuntu.com/core/doc
 """
 
 import asyncio
+import functools
 import os
-import psutil
 import re
+import shlex
+import signal
 import sys
-from time import sleep
-from subprocess import Popen, PIPE, STDOUT
+from time import monotonic, sleep
+from subprocess import Popen, DEVNULL, PIPE, STDOUT
 
 
+# The 'bluetoothctl show' line parser, compiled once at import time. The three original
+# per-call patterns (UUID lines, generic 'key: value' lines, the Controller banner) are
+# fused into a single alternation - earlier branches win, preserving the old try-each-
+# pattern-in-order behavior - so each output line is matched exactly once.
+_SHOW_PATTERN = re.compile(
+    r"^\s*(?:"
+    r"(?P<uuid_key>UUID:\s+[^(]+)\((?P<uuid_value>.*)\)\s*$"
+    r"|(?P<kv_key>[^:]+):\s+(?P<kv_value>.*)$"
+    r"|(?P<ctrl_key>Controller)\s+(?P<ctrl_value>\S+)"
+    r")",
+    re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=None)
 def assert_exists_and_executable(file):
+    # Memoized: each path is stat'd/access-checked once per process, so constructing many
+    # Pybluez_ez instances (e.g. from the test suite) doesn't repeat the same four syscalls
     if not os.path.isfile(file):
         print(f"\nERROR: {file} does not exist or is not a file", file=sys.stderr)
         raise FileNotFoundError
@@ -95,6 +114,91 @@ def assert_exists_and_executable(file):
         raise PermissionError
 
 
+def _spawn_capture(argv):
+    """
+    Launch a child process and capture its combined stdout and stderr.
+
+    On POSIX hosts this uses os.posix_spawn, which skips the comparatively heavy fork
+    preparation that subprocess.Popen performs in Python (fd bookkeeping, preexec plumbing)
+    and lets glibc use vfork/posix_spawn under the hood - a measurably cheaper launch for a
+    process as large as a Python interpreter. Elsewhere it falls back to Popen.
+
+    Args..
+        argv (list of str) - the executable and its arguments.
+
+    Returns..
+        child_return_code (int), stdout (bytes) - the child's exit code and everything it
+                                                  wrote to stdout and stderr.
+    """
+
+    if not hasattr(os, 'posix_spawn'):
+        forked = Popen(argv, stdout=PIPE, stdin=DEVNULL, stderr=STDOUT)
+        stdout = forked.communicate()[0]
+        return forked.returncode, stdout
+
+    r, w = os.pipe()
+    try:
+        pid = os.posix_spawn(
+            argv[0], argv, os.environ,
+            file_actions=[
+                (os.POSIX_SPAWN_DUP2, w, 1),
+                (os.POSIX_SPAWN_DUP2, w, 2),
+                (os.POSIX_SPAWN_CLOSE, w),
+            ])
+    except Exception:
+        os.close(r)
+        raise
+    finally:
+        os.close(w)
+
+    chunks = []
+    while True:
+        data = os.read(r, 65536)
+        if not data:
+            break
+        chunks.append(data)
+    os.close(r)
+
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status), b''.join(chunks)
+
+
+def _spawn_discard(argv):
+    """
+    Launch a child process, discarding everything it writes.
+
+    This is the companion of _spawn_capture for fire-and-check commands whose output nobody
+    examines (e.g. 'bluetoothctl scan off'): the child's stdout and stderr go straight to
+    /dev/null, so no pipe is created and no output bytes are ever read, decoded or stored.
+
+    Args..
+        argv (list of str) - the executable and its arguments.
+
+    Returns..
+        child_return_code (int), b'' - the child's exit code and an empty bytes placeholder,
+                                       matching the shape of _spawn_capture.
+    """
+
+    if not hasattr(os, 'posix_spawn'):
+        forked = Popen(argv, stdout=DEVNULL, stdin=DEVNULL, stderr=DEVNULL)
+        forked.communicate()
+        return forked.returncode, b''
+
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    try:
+        pid = os.posix_spawn(
+            argv[0], argv, os.environ,
+            file_actions=[
+                (os.POSIX_SPAWN_DUP2, devnull, 1),
+                (os.POSIX_SPAWN_DUP2, devnull, 2),
+            ])
+    finally:
+        os.close(devnull)
+
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status), b''
+
+
 def run_btsvc_cmd(subcmd, verbose=None, fail_to_exception=None):
     """
     Run a specific bluetooth service command (/etc/init.d/bluetooth)
@@ -102,7 +206,7 @@ def run_btsvc_cmd(subcmd, verbose=None, fail_to_exception=None):
     Args..
         subcmd (list of str) - the /etc/init.d/bluetooth sub-command to be run, followed by the sub-command's parameters.
 
-        verbose (bool) - If true, the command's return code, stdout and stderr will be printed. Default: True
+        verbose (bool) - If true, the command's return code, stdout and stderr will be printed. Default: False
 
         fail_to_exception (bool) - If true, a ChildProcessError is raised if the return code is non-zero. Default: False
 
@@ -112,7 +216,7 @@ def run_btsvc_cmd(subcmd, verbose=None, fail_to_exception=None):
     """
 
     if verbose is None:
-        verbose = True
+        verbose = False
 
     if fail_to_exception is None:
         fail_to_exception = False
@@ -125,9 +229,7 @@ def run_btsvc_cmd(subcmd, verbose=None, fail_to_exception=None):
         print(f"ERROR: {subcmd} is neither str nor list")
         raise TypeError
 
-    forked = Popen(full_cmd, stdout=PIPE, stdin=PIPE, stderr=STDOUT)
-    stdout = forked.communicate()[0]
-    rc = forked.returncode
+    rc, stdout = _spawn_capture(full_cmd)
 
     if verbose:
         print()
@@ -142,24 +244,85 @@ def run_btsvc_cmd(subcmd, verbose=None, fail_to_exception=None):
     return rc, stdout
 
 
-def run_btctl_cmd(subcmd, verbose=None, fail_to_exception=None):
+def run_btctl_cmd(subcmd, verbose=None, fail_to_exception=None, capture=True):
     """
     Run a specific bluetoothctl command
 
     Args..
         subcmd (list of str) - the bluetoothctl sub-command to be run, followed by the sub-command's parameters.
 
-        verbose (bool) - If true, the command's return code, stdout and stderr will be printed. Default: True
+        verbose (bool) - If true, the command's return code, stdout and stderr will be printed. Default: False
+
+        fail_to_exception (bool) - If true, a ChildProcessError is raised if the return code is non-zero. Default: False
+
+        capture (bool) - If false, the child's output goes to /dev/null and the returned stdout is b''.
+                         Use for fire-and-check commands where only the return code matters. Default: True
+
+    Returns..
+        child_return_code (int), stdout (str) - A tuple containing the child process' return code and the contents
+                                                of the child process' stdout and stderr.
+    """
+
+    if verbose is None:
+        verbose = False
+
+    if fail_to_exception is None:
+        fail_to_exception = False
+
+    if isinstance(subcmd, str):
+        full_cmd = [Pybluez_ez.BLUETOOTHCTL, subcmd]
+    elif isinstance(subcmd, list):
+        full_cmd = [Pybluez_ez.BLUETOOTHCTL] + subcmd
+    else:
+        print(f"ERROR: {subcmd} is neither str nor list")
+        raise TypeError
+
+    if capture:
+        rc, stdout = _spawn_capture(full_cmd)
+    else:
+        rc, stdout = _spawn_discard(full_cmd)
+
+    if verbose:
+        print()
+        print(f"CMD: {full_cmd}")
+        print(f"rc: {rc}")
+        print(f"{stdout.decode()}")
+
+    if fail_to_exception:
+        if rc != 0:
+            raise ChildProcessError
+
+    return rc, stdout
+
+
+async def run_btctl_cmd_async(subcmd, verbose=None, fail_to_exception=None, timeout=30.0):
+    """
+    Run a specific bluetoothctl command as a coroutine.
+
+    This is the awaitable counterpart of run_btctl_cmd(). Because it does not block the event
+    loop while the child runs, several independent commands can be launched together (see
+    Pybluez_ez.run_concurrently) so their process-startup and bluetoothd round-trip costs
+    overlap instead of accumulating serially.
+
+    Args..
+        subcmd (list of str) - the bluetoothctl sub-command to be run, followed by the sub-command's parameters.
+
+        verbose (bool) - If true, the command's return code, stdout and stderr will be printed. Default: False
 
         fail_to_exception (bool) - If true, a ChildProcessError is raised if the return code is non-zero. Default: False
 
+        timeout (float) - Maximum seconds to wait for the command. A command that exceeds this
+                          (e.g. 'connect' against a dead peer) is killed and a ChildProcessError
+                          is raised, so the calling flow recovers instead of hanging. Pass a
+                          larger value for commands that legitimately run long. Default: 30.0
+
     Returns..
         child_return_code (int), stdout (str) - A tuple containing the child process' return code and the contents
                                                 of the child process' stdout and stderr.
     """
 
     if verbose is None:
-        verbose = True
+        verbose = False
 
     if fail_to_exception is None:
         fail_to_exception = False
@@ -172,9 +335,17 @@ def run_btctl_cmd(subcmd, verbose=None, fail_to_exception=None):
         print(f"ERROR: {subcmd} is neither str nor list")
         raise TypeError
 
-    forked = Popen(full_cmd, stdout=PIPE, stdin=PIPE, stderr=STDOUT)
-    stdout = forked.communicate()[0]
-    rc = forked.returncode
+    proc = await asyncio.create_subprocess_exec(
+        *full_cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT)
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise ChildProcessError(f"{full_cmd} timed out after {timeout}s")
+    rc = proc.returncode
 
     if verbose:
         print()
@@ -189,132 +360,368 @@ def run_btctl_cmd(subcmd, verbose=None, fail_to_exception=None):
     return rc, stdout
 
 
+async def _stream_pipe(stream, prefix):
+    """
+    Read lines from an async stream as they arrive, printing each with a prefix.
+
+    This is a helper for run_wait(). Streaming the output keeps memory usage constant regardless of
+    how much the child writes, and the caller sees output as it is produced rather than all at once
+    when the child exits.
+
+    Args..
+        stream (asyncio.StreamReader) - the child process pipe to drain
+
+        prefix (str) - a tag (e.g. '[stdout] ') printed before each line
+    """
+
+    async for line in stream:
+        print(f'{prefix}{line.decode()}', end='')
+
+
 async def run_wait(cmd):
     """
-    Run an async command, blocking until it completes. Upon completion, print the command's stdout and stderr.
+    Run an async command, blocking until it completes. The command's stdout and stderr are streamed
+    to the terminal line-by-line as they are produced.
+
+    The command is executed directly (no intermediate shell). This saves a fork+exec of /bin/sh per
+    command and ensures the spawned process is the actual command, not a shell wrapping it.
 
     Args..
-        cmd (str) - the full command to be run, including executable and all command line arguments
+        cmd (str, or list of str) - the full command to be run, including executable and all command
+                                    line arguments. A string is tokenized with shlex.split().
     """
 
-    proc = await asyncio.create_subprocess_shell(
-        cmd,
+    if isinstance(cmd, str):
+        cmd = shlex.split(cmd)
+
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE)
 
-    stdout, stderr = await proc.communicate()
+    # Drain both pipes concurrently while waiting for the child to exit. communicate() would
+    # buffer the entire output in RAM first; the streaming readers print it as it arrives.
+    await asyncio.gather(
+        _stream_pipe(proc.stdout, '[stdout] '),
+        _stream_pipe(proc.stderr, '[stderr] '),
+        proc.wait())
 
     print(f'[{cmd!r} exited with {proc.returncode}]')
-    if stdout:
-        print(f'[stdout]\n{stdout.decode()}')
-    if stderr:
-        print(f'[stderr]\n{stderr.decode()}')
 
 
 async def run_async(cmd):
     """
     Run an external command asynchronously, without blocking. Returns the async process object.
 
+    The command is executed directly (no intermediate shell). This saves a fork+exec of /bin/sh per
+    command and, importantly, means the returned process object refers to the command itself - so
+    terminating it (e.g. proc.kill()) acts on the command and not on a wrapping shell.
+
     Args..
-        cmd (str) - the full command to be run, including executable and all command line arguments
+        cmd (str, or list of str) - the full command to be run, including executable and all command
+                                    line arguments. A string is tokenized with shlex.split().
 
     Returns..
         proc () - The process' asyncio object (<class 'asyncio.subprocess.Process'>)
     """
 
-    return await asyncio.create_subprocess_shell(
-        cmd,
+    if isinstance(cmd, str):
+        cmd = shlex.split(cmd)
+
+    return await asyncio.create_subprocess_exec(
+        *cmd,
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE)
 
 
+class BtctlSession:
+    """
+    A single long-lived interactive bluetoothctl child process.
+
+    Each one-shot bluetoothctl invocation pays for process startup plus a fresh D-Bus
+    handshake with bluetoothd before it does any work. This class keeps one interactive
+    bluetoothctl running for the session's lifetime, writes sub-commands to its stdin and
+    reads back the reply, so repeated primitives cost only a pipe round-trip.
+
+    Reply framing: after each sub-command we write a unique bogus command (the sentinel).
+    bluetoothctl echoes the sentinel in its 'Invalid command' complaint, and everything
+    read before that line is the reply to the real sub-command.
+
+    Note that interactive bluetoothctl does not expose a per-command exit status, so run()
+    always reports a return code of 0. Callers that need a real exit status should use the
+    one-shot run_btctl_cmd() instead.
+    """
+
+    SENTINEL_PREFIX = "pybluez-ez-sentinel-"
+
+    def __init__(self):
+        self._proc = Popen([Pybluez_ez.BLUETOOTHCTL], stdout=PIPE, stdin=PIPE, stderr=STDOUT)
+        self._counter = 0
+
+    def run(self, subcmd):
+        """
+        Run one bluetoothctl sub-command inside the persistent session.
+
+        Args..
+            subcmd (str, or list of str) - the sub-command and its parameters.
+
+        Returns..
+            (0, stdout (bytes)) - matching the (rc, stdout) shape of run_btctl_cmd().
+        """
+
+        if isinstance(subcmd, list):
+            subcmd = ' '.join(subcmd)
+
+        self._counter += 1
+        sentinel = f'{BtctlSession.SENTINEL_PREFIX}{self._counter}'
+
+        self._proc.stdin.write(f'{subcmd}\n{sentinel}\n'.encode())
+        self._proc.stdin.flush()
+
+        lines = []
+        while True:
+            line = self._proc.stdout.readline()
+            if not line:
+                raise ChildProcessError("bluetoothctl session terminated unexpectedly")
+            if sentinel.encode() in line:
+                break
+            lines.append(line)
+
+        return 0, b''.join(lines)
+
+    def close(self):
+        """
+        Shut down the persistent bluetoothctl child.
+        """
+
+        try:
+            self._proc.stdin.write(b'quit\n')
+            self._proc.stdin.flush()
+            self._proc.wait(timeout=2)
+        except Exception:
+            self._proc.kill()
+
+
 class Pybluez_ez:
 
     BLUETOOTHCTL = "/usr/bin/bluetoothctl"
     INITD_BLUETOOTH = "/etc/init.d/bluetooth"
 
-    def __init__(self):
+    def __init__(self, persistent=False):
         self.bluetoothctl = Pybluez_ez.BLUETOOTHCTL
         self.initd_bluetooth = Pybluez_ez.INITD_BLUETOOTH
         assert_exists_and_executable(self.bluetoothctl)
         assert_exists_and_executable(self.initd_bluetooth)
+        # With persistent=True all bluetoothctl sub-commands are written to one long-lived
+        # interactive child (see BtctlSession) instead of forking a process per command.
+        self._session = BtctlSession() if persistent else None
+        # The instance's private event loop, created on first use (see _get_loop)
+        self._loop = None
         self.bt_settings = {}
         self.bt_scanning_proc = None
+        self.bt_scanning_pid = None
+        # TTL cache for show(). Holds (timestamp, rc, stdout, settings) so bursts of
+        # state checks don't each fork a fresh bluetoothctl. See show() and
+        # _invalidate_show_cache().
+        self._show_cache = None
+        self._show_ttl = 0.5
 
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     # Command primitives - Error checking and complex processing occurs only in higher
     #                      level methods.
+    #
+    # The primitives are 12 copies of the same body, so instead of 12 method definitions
+    # they are declared in the _SUBCMDS table and generated on first use by __getattr__
+    # below. Each entry maps a method name to (number of arguments, mutates-state flag);
+    # mutating primitives invalidate the show() TTL cache before running. The bluetoothctl
+    # sub-command is the method name with underscores replaced by dashes.
+
+    _SUBCMDS = {
+        'devices': (0, False),
+        'paired_devices': (0, False),
+        'info': (1, False),
+        'trust': (1, True),
+        'untrust': (1, True),
+        'pair': (1, True),
+        'cancel_pairing': (1, True),
+        'connect': (1, True),
+        'disconnect': (1, True),
+        'remove': (1, True),
+        'block': (1, True),
+        'unblock': (1, True),
+    }
+
+    def __getattr__(self, name):
+        """
+        Generate a command primitive on first access, from the _SUBCMDS table above.
 
-    def devices(self):
-        rc, stdout = run_btctl_cmd("devices")
-        return rc, stdout
+        The generated function is stored in the instance dict, so subsequent lookups of the
+        same primitive bypass this dispatch entirely. Attribute names not in the table raise
+        AttributeError as usual.
+        """
 
-    def paired_devices(self):
-        rc, stdout = run_btctl_cmd("paired-devices")
-        return rc, stdout
+        spec = Pybluez_ez._SUBCMDS.get(name)
+        if spec is None:
+            raise AttributeError(name)
 
-    def info(self, device):
-        rc, stdout = run_btctl_cmd(["info", device])
-        return rc, stdout
+        arity, mutates = spec
+        subcmd = name.replace('_', '-')
 
-    def trust(self, device):
-        rc, stdout = run_btctl_cmd(["trust", device])
-        return rc, stdout
+        if arity == 0:
+            def primitive():
+                rc, stdout = self._run_btctl(subcmd)
+                return rc, stdout
+        else:
+            def primitive(device):
+                if mutates:
+                    self._invalidate_show_cache()
+                rc, stdout = self._run_btctl([subcmd, device])
+                return rc, stdout
+
+        primitive.__name__ = name
+        primitive.__qualname__ = f'Pybluez_ez.{name}'
+        self.__dict__[name] = primitive
+        return primitive
+
+    def run_concurrently(self, *subcmds, verbose=None):
+        """
+        Run several read-only bluetoothctl sub-commands concurrently.
 
-    def untrust(self, device):
-        rc, stdout = run_btctl_cmd(["untrust", device])
-        return rc, stdout
+        All of the given sub-commands are launched together on one event loop and awaited as a
+        group, so the wall-clock cost is roughly that of the slowest command rather than the sum
+        of all of them. Only use this for commands with no ordering dependency (e.g. 'devices',
+        'paired-devices', 'show') - scan toggles and pairing operations must remain sequential.
 
-    def pair(self, device):
-        rc, stdout = run_btctl_cmd(["pair", device])
-        return rc, stdout
+        Args..
+            subcmds - One or more bluetoothctl sub-commands, each a str or list of str as
+                      accepted by run_btctl_cmd().
 
-    def cancel_pairing(self, device):
-        rc, stdout = run_btctl_cmd(["cancel-pairing", device])
-        return rc, stdout
+            verbose (bool) - Passed through to each command. Default: False
 
-    def connect(self, device):
-        rc, stdout = run_btctl_cmd(["connect", device])
-        return rc, stdout
+        Returns..
+            A list of (child_return_code, stdout) tuples, in the same order as the sub-commands.
+        """
 
-    def disconnect(self, device):
-        rc, stdout = run_btctl_cmd(["disconnect", device])
-        return rc, stdout
+        async def _gather():
+            return await asyncio.gather(
+                *(run_btctl_cmd_async(subcmd, verbose) for subcmd in subcmds))
 
-    def remove(self, device):
-        rc, stdout = run_btctl_cmd(["remove", device])
-        return rc, stdout
+        return self._run(_gather())
 
-    def block(self, device):
-        rc, stdout = run_btctl_cmd(["block", device])
-        return rc, stdout
+    def info_many(self, devices, verbose=None, max_concurrency=8):
+        """
+        Fetch 'bluetoothctl info <device>' for several devices concurrently.
 
-    def unblock(self, device):
-        rc, stdout = run_btctl_cmd(["unblock", device])
-        return rc, stdout
+        Enumerating devices one info() call at a time serializes a fork of bluetoothctl per
+        device. Here all the queries are launched together on the instance's event loop, with
+        a semaphore capping how many children run at once so bluetoothd is not flooded.
+
+        Args..
+            devices - An iterable of device MAC addresses (or name prefixes, as accepted by
+                      bluetoothctl info).
+
+            verbose (bool) - Passed through to each command. Default: False
+
+            max_concurrency (int) - Maximum number of bluetoothctl children alive at once. Default: 8
+
+        Returns..
+            A list of (child_return_code, stdout) tuples, in the same order as the input devices.
+        """
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _info_one(device):
+            async with semaphore:
+                return await run_btctl_cmd_async(["info", device], verbose)
+
+        async def _gather():
+            return await asyncio.gather(*(_info_one(device) for device in devices))
+
+        return self._run(_gather())
 
-    def status(self):
+    def status(self, verbose=None):
         """
         Run '/etc/init.d/bluetooth status'
 
+        Args..
+            verbose (bool) - Passed through to the command. Default: False
+
         Returns..
             (child_return_code (int), stdout (str)) - A tuple containing the child process' return code and the contents
                                                       of the child process' stdout and stderr.
         """
 
-        rc, stdout = run_btsvc_cmd("status")
+        rc, stdout = run_btsvc_cmd("status", verbose)
         return rc, stdout
 
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     # High level methods - These methods rely on the command primitives to accomplish
     #                      more complex tasks.
 
-    def show(self, verbose=None):
+    def _get_loop(self):
+        """
+        Return this instance's private event loop, creating it on first use.
+
+        asyncio.run() builds and tears down a fresh event loop on every call. Besides the
+        setup cost, any subprocess transport created inside (such as the scanning process)
+        would be left bound to a destroyed loop. Sharing one loop across the instance keeps
+        those transports valid for the instance's whole lifetime.
+        """
+
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop
+
+    def _run(self, coro):
+        """
+        Run a coroutine to completion on the instance's shared event loop and return its result.
+        """
+
+        return self._get_loop().run_until_complete(coro)
+
+    def _run_btctl(self, subcmd, verbose=None):
+        """
+        Route one bluetoothctl sub-command through the persistent session when one exists,
+        otherwise through a one-shot run_btctl_cmd() invocation.
+        """
+
+        if self._session is not None:
+            return self._session.run(subcmd)
+        return run_btctl_cmd(subcmd, verbose)
+
+    def close(self):
+        """
+        Release resources held by this instance (currently just the persistent bluetoothctl
+        session, if one was requested).
+        """
+
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
+    def _invalidate_show_cache(self):
+        """
+        Drop the cached show() result. Called by every method that changes controller or
+        device state, so the next show() re-queries bluetoothctl.
+        """
+
+        self._show_cache = None
+
+    def show(self, verbose=None, force=False):
         """
         Run 'bluetoothctl show'. Save settings to a dictionary.
 
+        Results are cached for a short TTL (self._show_ttl seconds). Back-to-back state checks
+        (e.g. check_if_scanning right after scan_off) are answered from the cache instead of
+        forking another bluetoothctl. Any state-mutating method invalidates the cache.
+
         Args..
-            verbose (bool) - If true, the command's return code, stdout and stderr will be printed. Default: True
+            verbose (bool) - If true, the command's return code, stdout and stderr will be printed. Default: False
+
+            force (bool) - If true, bypass the TTL cache and query bluetoothctl afresh. Default: False
 
         Returns..
 
@@ -327,27 +734,44 @@ class Pybluez_ez:
         """
 
         if verbose is None:
-            verbose = True
-
-        rc, stdout = run_btctl_cmd("show", verbose)
-
-        self.bt_settings = {}
+            verbose = False
+
+        if not force and self._show_cache is not None:
+            cached_at, rc, stdout, bt_settings = self._show_cache
+            if monotonic() - cached_at < self._show_ttl:
+                self.bt_settings = bt_settings
+                return rc, stdout, bt_settings
+
+        rc, stdout = self._run_btctl("show", verbose)
+
+        # Parse into a local dict and publish it with one attribute store at the end -
+        # keeps the per-line work free of self.bt_settings descriptor lookups.
+        settings = {}
+
+        # The pattern is compiled IGNORECASE, so only the captured key needs lowercasing
+        # (the dict keys like 'discovering' are looked up lowercase elsewhere) - values
+        # keep their original case, which matters for MAC addresses and hex UUIDs.
+        # Bind the compiled pattern's match method once so the loop body runs on locals
+        match = _SHOW_PATTERN.match
+
+        # bluetoothctl output is ASCII; the ascii codec takes CPython's fast memcpy path
+        # instead of UTF-8 validation, and 'replace' keeps any stray byte from raising.
+        for line in stdout.decode('ascii', 'replace').splitlines():
+            parsed = match(line)
+            if parsed is None:
+                continue
+            if parsed.group('uuid_key') is not None:
+                key, value = parsed.group('uuid_key'), parsed.group('uuid_value')
+            elif parsed.group('kv_key') is not None:
+                key, value = parsed.group('kv_key'), parsed.group('kv_value')
+            else:
+                key, value = parsed.group('ctrl_key'), parsed.group('ctrl_value')
+            settings[key.strip().lower()] = value.strip()
 
-        pattern1 = re.compile("^\s*(?P<key>UUID:\s+[^(]+)\((?P<value>.*)\)\s*$")
-        pattern2 = re.compile("^\s*(?P<key>[^:]+):\s+(?P<value>.*)$")
-        pattern3 = re.compile("^\s*(?P<key>Controller)\s+(?P<value>\S+)")
-
-        for line in stdout.decode().split('\n'):
-            line = line.lower()
-            for pattern in [pattern1, pattern2, pattern3]:
-                parsed = re.match(pattern, line)
-                if parsed is not None:
-                    key = parsed.group('key').strip()
-                    value = parsed.group('value').strip()
-                    self.bt_settings[key] = value
-                    break
+        self.bt_settings = settings
+        self._show_cache = (monotonic(), rc, stdout, settings)
 
-        return rc, stdout, self.bt_settings
+        return rc, stdout, settings
 
     def check_if_scanning(self, check_if_enabled=True):
         """
@@ -365,7 +789,7 @@ class Pybluez_ez:
             print("Checking if scanning is enabled..")
         else:
             print("Checking if scanning is disabled..")
-        rc, stdout, bt_settings = btctl.show(verbose=False)
+        rc, stdout, bt_settings = self.show(verbose=False)
         if 'discovering' not in bt_settings.keys():
             print('ERROR: Unable to determine if bluetooth scanning is already enabled.', file=sys.stderr)
             raise ValueError
@@ -387,11 +811,43 @@ class Pybluez_ez:
             print(f"ERROR: invalid value for bluetooth discover mode: {bt_settings['discovering']}", file=sys.stderr)
             raise ValueError
 
+    def wait_for_scanning_state(self, enabled, timeout=5.0, interval=0.25):
+        """
+        Wait until the default controller's scanning state matches the requested state.
+
+        bluetoothctl's 'scan on'/'scan off' return before the controller actually flips its
+        discovering flag, so callers need to wait for the transition. Rather than sleeping a
+        fixed amount and hoping (the old approach), this polls the controller state at a short
+        interval and returns as soon as the transition is observed, or gives up at the timeout.
+
+        Args..
+            enabled (bool) - The desired scanning state to wait for.
+
+            timeout (float) - Maximum seconds to keep polling. Default: 5.0
+
+            interval (float) - Seconds between polls. Default: 0.25
+
+        Returns..
+            True if the desired state was observed within the timeout, otherwise False.
+        """
+
+        want = 'yes' if enabled else 'no'
+        deadline = monotonic() + timeout
+
+        while True:
+            # force=True: we are polling for a transition, so the TTL cache must be bypassed
+            rc, stdout, bt_settings = self.show(verbose=False, force=True)
+            if bt_settings.get('discovering') == want:
+                return True
+            if monotonic() >= deadline:
+                return False
+            sleep(interval)
+
     def check_if_scanning_enabled(self):
-        return btctl.check_if_scanning(check_if_enabled=True)
+        return self.check_if_scanning(check_if_enabled=True)
 
     def check_if_scanning_disabled(self):
-        return btctl.check_if_scanning(check_if_enabled=False)
+        return self.check_if_scanning(check_if_enabled=False)
 
     def scan_on(self):
         """
@@ -410,62 +866,63 @@ class Pybluez_ez:
         print()
         print("Received request to enable bluetooth scanning")
 
-        if btctl.check_if_scanning_enabled():
+        if self.check_if_scanning_enabled():
             print('NOTICE: bluetooth scanning is already enabled. Not attempting to re-enable.', file=sys.stderr)
             return None
 
-        proc = asyncio.run(run_async(f'{Pybluez_ez.BLUETOOTHCTL} scan on'))
+        # Spawn 'bluetoothctl scan on' directly (no shell) and in its own session. The child
+        # PID is therefore bluetoothctl itself, and start_new_session gives it a process group
+        # of its own so scan_off_via_asyncio can signal the whole group to stop scanning.
+        async def _spawn_scan():
+            return await asyncio.create_subprocess_exec(
+                Pybluez_ez.BLUETOOTHCTL, 'scan', 'on',
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+                start_new_session=True)
 
-        print('Pause pi seconds then confirm scanning was in fact enabled..')
-        sleep(3.14159)
+        proc = self._run(_spawn_scan())
+        self._invalidate_show_cache()
 
-        rc, stdout, bt_settings = btctl.show(verbose=False)
+        print('Waiting for the controller to report that scanning is enabled..')
 
-        if btctl.check_if_scanning_enabled():
+        if self.wait_for_scanning_state(True):
             print('OK: bluetooth scanning is enabled.')
             self.bt_scanning_proc = proc
+            self.bt_scanning_pid = proc.pid
             return proc
         else:
-            print('Unable to enable bluetooth scanning', file=stderr)
+            print('Unable to enable bluetooth scanning', file=sys.stderr)
             return None
 
     def scan_off_via_asyncio(self):
         """
         If the current instance of this process had previously enabled scanning via an asyncio process, then the cleanest
-        way to stop the scanning is by terminating that process. This method checks to see if an asyncio process for
-        bluetooth scanning exists in memory and, if so, attempts to terminate it.
-
-        TODO: There is a serious problem with killing the asyncio process..
-
-        First of all, I'm using asyncio.create_subprocess_shell(), and the "bluetoothctl scan on" process is a child of
-        the shell created by asyncio. I can kill the shell process, but the "bluetoothctl scan on" command remains running.
-
-        The proper approach is to avoid spawning a shell by using asyncio.create_subprocess_exec(). But I am having
-        difficulty getting this to work!
-
-        Hence, for the time being, I am unable to reliably shut down a scanning process that was created in the same
-        python runtime.
-
-        I am, however, able to kill it if I run this python script a second time .. which will kill the process via
-        python's psutil module.
-
-        Until the issues are resolved, please avoid attempting to disable scanning in the same python session from which
-        it was started.
+        way to stop the scanning is by terminating that process. This method checks to see if a scanning process was
+        started by this instance and, if so, terminates it.
 
+        Because scan_on() spawns 'bluetoothctl scan on' directly (no intermediate shell) and in its own session, the
+        recorded PID is bluetoothctl itself and heads its own process group. Signalling that group terminates the
+        scanner reliably, without needing to hunt for it among all of the host's processes.
         """
 
         # Constants for the return values..
         ACTIVE_OR_UNKNOWN = False
         INACTIVE = True
 
-        if self.bt_scanning_proc is not None:
-            print("Found asyncio process for bluetooth scanning. Will attempt to terminate it..")
+        if self.bt_scanning_pid is not None:
+            print("Found the scanning process started by this instance. Will attempt to terminate it..")
 
-            self.bt_scanning_proc.kill()
+            try:
+                os.killpg(self.bt_scanning_pid, signal.SIGTERM)
+            except ProcessLookupError:
+                # The process is already gone, which is the outcome we wanted anyway
+                pass
+            self._invalidate_show_cache()
 
-            if btctl.check_if_scanning_disabled():
+            if self.check_if_scanning_disabled():
                 print('OK: bluetooth scanning is disabled.')
                 self.bt_scanning_proc = None
+                self.bt_scanning_pid = None
                 return INACTIVE
             else:
                 print('WARNING: Unable to confirm bluetooth scanning was successfully disabled.', file=sys.stderr)
@@ -490,20 +947,19 @@ class Pybluez_ez:
         print()
         print("Received request to disable bluetooth scanning via the bluetoothctl CLI")
 
-        if btctl.check_if_scanning_disabled():
+        if self.check_if_scanning_disabled():
             print('NOTICE: bluetooth scanning is already disabled. Not attempting to disable.', file=sys.stderr)
             return INACTIVE
 
         print('Detected that scanning is currently enabled. Continue attempting to disable..')
 
-        rc, stdout = run_btctl_cmd(["scan", "off"])
+        # Nothing examines the output of 'scan off', so don't capture it
+        rc, stdout = run_btctl_cmd(["scan", "off"], capture=False)
+        self._invalidate_show_cache()
 
-        print('Pausing pi seconds then confirming scanning was in fact disabled..')
-        sleep(3.14159)
+        print('Waiting for the controller to report that scanning is disabled..')
 
-        rc, stdout, bt_settings = btctl.show(verbose=False)
-
-        if btctl.check_if_scanning_disabled():
+        if self.wait_for_scanning_state(False):
             print('OK: bluetooth scanning is disabled.')
             return INACTIVE
         else:
@@ -516,29 +972,124 @@ class Pybluez_ez:
         if an explicit "bluetoothctl scan on" command is already running on the host.
         """
 
+        # psutil is only needed by this last-resort fallback, so it is imported here rather
+        # than at module top - the happy paths never pay its C-extension load time
+        import psutil
+
         killed = 0
-        for proc in psutil.process_iter(['name', 'cmdline', 'pid', 'username']):
-            if 'scan' in proc.cmdline():
-                if 'bluetoothctl' in proc.info['name'] and len(proc.info['cmdline']) == 3:
-                    if 'bluetoothctl' in proc.info['cmdline'][0] \
-                            and proc.info['cmdline'][1] == 'scan' \
-                            and proc.info['cmdline'][2] == 'on':
-                        print(f'Killing bluetooth scan proc: {proc}')
-                        proc.kill()
-                        killed += 1
+        for proc in psutil.process_iter(['name']):
+            # Cheap first-stage filter on the process name alone (a single /proc/<pid>/comm
+            # read). Only candidates that pass it pay for the full cmdline fetch. Exact
+            # comparison, so e.g. a hypothetical 'bluetoothctl-helper' is not swept up.
+            if proc.info['name'] != 'bluetoothctl':
+                continue
+            cmdline = proc.cmdline()
+            if len(cmdline) != 3 or cmdline[1] != 'scan' or cmdline[2] != 'on':
+                continue
+            if os.path.basename(cmdline[0]) != 'bluetoothctl':
+                continue
+            print(f'Killing bluetooth scan proc: {proc}')
+            proc.kill()
+            killed += 1
 
         if killed > 0:
-            for proc in psutil.process_iter(['name', 'cmdline', 'pid', 'username']):
-                if 'scan' in proc.cmdline():
-                    if 'bluetoothctl' in proc.info['name'] and len(proc.info['cmdline']) == 3:
-                        if 'bluetoothctl' in proc.info['cmdline'][0] \
-                                and proc.info['cmdline'][1] == 'scan' \
-                                and proc.info['cmdline'][2] == 'on':
-                            print(f'ERROR: bluetooth scanning proc still active: {proc}', file=stderr)
-                            return False
+            self._invalidate_show_cache()
+            # Verify via the controller's own discovering flag rather than walking the
+            # host's process table a second time
+            if not self.wait_for_scanning_state(False):
+                print(f'ERROR: bluetooth scanning still active after killing {killed} scan proc(s)', file=sys.stderr)
+                return False
 
         return True
 
+    def add_device(self, device):
+        """
+        Add a device to the host's bluetooth subsystem: trust, pair, then connect.
+
+        This automates the documented workaround procedure from the module header. Scanning is
+        enabled first if it isn't already (waiting only until the controller confirms, not a
+        fixed pause), the trust/pair/connect sequence is then issued back-to-back - BlueZ wants
+        these ordered, so they stay serial, but there are no sleeps between them - and scanning
+        is restored to its prior state afterwards.
+
+        Args..
+            device (str) - The MAC address of the device to be added.
+
+        Returns..
+            True if trust, pair and connect all succeeded, otherwise False.
+        """
+
+        print()
+        print(f"Received request to add device {device}")
+
+        scanning_was_enabled = self.check_if_scanning_enabled()
+        if not scanning_was_enabled:
+            self.scan_on()
+
+        try:
+            ok = True
+            for step in (self.trust, self.pair, self.connect):
+                rc, stdout = step(device)
+                if rc != 0:
+                    print(f"ERROR: {step.__name__} {device} failed (rc={rc})", file=sys.stderr)
+                    ok = False
+                    break
+        finally:
+            # Leave scanning the way we found it
+            if not scanning_was_enabled:
+                self.scan_off()
+
+        return ok
+
+    def add_devices(self, devices, concurrency=4):
+        """
+        Add several devices, overlapping their trust/pair/connect sequences.
+
+        BlueZ requires trust, pair and connect to stay ordered per device, but separate
+        devices are independent - so each device gets its own serial chain and the chains
+        run concurrently on the instance's event loop, bounded by a semaphore so bluetoothd
+        isn't asked to juggle too many pairing dialogs at once. Total wall-clock time
+        approaches that of the slowest device rather than the sum of all of them.
+
+        Args..
+            devices - An iterable of device MAC addresses to be added.
+
+            concurrency (int) - Maximum number of devices being worked on at once. Default: 4
+
+        Returns..
+            A dict mapping each device to True (all three steps succeeded) or False.
+        """
+
+        devices = list(devices)
+
+        scanning_was_enabled = self.check_if_scanning_enabled()
+        if not scanning_was_enabled:
+            self.scan_on()
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _add_one(device):
+            async with semaphore:
+                for step in ("trust", "pair", "connect"):
+                    rc, stdout = await run_btctl_cmd_async([step, device])
+                    if rc != 0:
+                        print(f"ERROR: {step} {device} failed (rc={rc})", file=sys.stderr)
+                        return False
+                return True
+
+        async def _gather():
+            return await asyncio.gather(*(_add_one(device) for device in devices))
+
+        try:
+            results = self._run(_gather())
+        finally:
+            self._invalidate_show_cache()
+            # Leave scanning the way we found it
+            if not scanning_was_enabled:
+                self.scan_off()
+
+        return dict(zip(devices, results))
+
     def scan_off(self):
         """
         Disable bluetooth scanning on the host's default controller. First we check if an asyncio process exists for the
@@ -557,9 +1108,10 @@ class Pybluez_ez:
 if __name__ == '__main__':
     btctl = Pybluez_ez()
     btctl.scan_off()
-    btctl.status()
-    btctl.show()
-    btctl.devices()
+    btctl.status(verbose=True)
+    # 'show' and 'devices' are independent read-only queries, so launch them together and
+    # let their process startup and bluetoothd round-trips overlap
+    btctl.run_concurrently('show', 'devices', verbose=True)
     btctl.scan_on()
     print('Sleeping 8 seconds..')
     sleep(8)
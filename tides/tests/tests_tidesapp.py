@@ -12,29 +12,33 @@ from tidesapp_viaSelenium import TidesApp
 
 class Tests_tidesapp_viaSelenium:
 
+    # One TidesApp instance per test class. Constructing the app (and any webdriver
+    # it may start) is by far the slowest part of these tests, and the methods under
+    # test don't depend on state left over from a prior parametrization, so every
+    # parametrized case below reuses this instance instead of building its own.
+    @pytest.fixture(scope='class')
+    def app(self):
+        return TidesApp()
+
     @pytest.mark.xfail
     @pytest.mark.parametrize("filename", ['../tests/nosuchfile.json'])
-    def test_load_user_locations_01(self, filename):
-        app = TidesApp()
+    def test_load_user_locations_01(self, app, filename):
         with pytest.raises(FileNotFoundError):
             app.load_user_locations(filename)
 
     @pytest.mark.parametrize("filename", [''])
-    def test_load_user_locations_02(self, filename):
-        app = TidesApp()
+    def test_load_user_locations_02(self, app, filename):
         app.load_user_locations()
 
     @pytest.mark.parametrize("filename", ['../tests/sample_input.json'])
-    def test_load_user_locations_03(self, filename):
-        app = TidesApp()
+    def test_load_user_locations_03(self, app, filename):
         app.load_user_locations(filename)
 
     @pytest.mark.xfail
     @pytest.mark.parametrize("data", [
      'Mon 22 3:36am ▼ 0.98 ft 9:09am ▲ 6.56 ft 3:41xx ▼ 1.64 ft ▲x5:57am ▼ 7:35pm',
     ])
-    def test_parse_high_tide_data_01(self, data):
-        app = TidesApp()
+    def test_parse_high_tide_data_01(self, app, data):
         with pytest.raises(ValueError):
             app.parse_high_tide_data(data)
 
@@ -45,8 +49,7 @@ class Tests_tidesapp_viaSelenium:
      ('Mon 22 3:36am ▼ 0.98 ft 9:09am ▲ 6.56 ft 3:41pm ▼ 1.64 ft ▲ 5:57am ▼ 7:35pm',
          [datetime(2022, 8, 22, 9, 9)]),
     ])
-    def test_parse_high_tide_data_02(self, data, expected):
-        app = TidesApp()
+    def test_parse_high_tide_data_02(self, app, data, expected):
         observed = app.parse_high_tide_data(data)
         assert observed == expected
 
@@ -57,8 +60,7 @@ class Tests_tidesapp_viaSelenium:
         ('Mon 22 3:36am ▼ 0.98 ft 9:09am ▲ 6.56 ft 3:41pm ▼ 1.64 ft ▲ 5:57am ▼ 7:35pm',
          [datetime(2022, 8, 22, 9, 9)]),
         ])
-    def test_parse_high_tide_data_03(self, data, expected):
-        app = TidesApp()
+    def test_parse_high_tide_data_03(self, app, data, expected):
         observed = app.parse_high_tide_data(data)
         assert observed == expected
 
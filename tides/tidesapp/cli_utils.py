@@ -5,9 +5,17 @@ A module for processing the user's command line (for tidesapp only).
 
 import argparse
 import os
+import stat
 import sys
 
 
+# Built once at import. Constructing an ArgumentParser (and its action table) is the
+# dominant cost of process_command_line, and the grammar never changes, so repeated
+# calls - the unit tests invoke this once per parametrization - reuse this parser.
+_PARSER = argparse.ArgumentParser()
+_PARSER.add_argument('-f', '--file')
+
+
 def process_command_line():
     """
     Processes the command line. Returns the name of the input file.
@@ -28,12 +36,15 @@ def process_command_line():
     filename (str) the name of a file containing location URLs.
     """
 
-    parser = argparse.ArgumentParser()
-    parser.add_argument('-f', '--file')
-    args = parser.parse_args(sys.argv[1:])
+    args = _PARSER.parse_args(sys.argv[1:])
     if not args.file:
         raise ValueError
-    if not os.path.isfile(args.file):
+    # One stat() answers both "does it exist" and "is it a regular file"
+    try:
+        mode = os.stat(args.file).st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        mode = 0
+    if not stat.S_ISREG(mode):
         print(f"ERROR: {args.file} does not exist or is not a file")
         raise FileNotFoundError
     return args.file
@@ -4,6 +4,27 @@ A module for manipulating dates and times for the tidesapp app.
 """
 
 from datetime import datetime, date
+from functools import lru_cache
+
+
+@lru_cache(maxsize=64)
+def _day2datetime(today_ordinal, queried_day):
+    """
+    The cached arithmetic core of day2datetime.
+
+    Keyed on today's ordinal so results stay correct across midnight
+    (and across freeze_time changes in the unit tests): a new day means
+    a new key, never a stale hit. The month/year overflow is computed
+    with divmod instead of branch-and-fixup - a day earlier than today
+    rolls into next month, and month thirteen rolls into January of the
+    following year, all in one arithmetic step.
+    """
+
+    today = date.fromordinal(today_ordinal)
+    months0 = today.month - 1 + (queried_day < today.day)
+    queried_year = today.year + months0 // 12
+    queried_month = months0 % 12 + 1
+    return datetime(queried_year, queried_month, queried_day)
 
 
 def day2datetime(queried_day: int):
@@ -42,28 +63,19 @@ def day2datetime(queried_day: int):
     if not isinstance(queried_day, int):
         raise ValueError
 
-    # Get today's datetime
-    today_datetime = date.today()
-
-    # Initialize the queried day's month and year
-    queried_month = today_datetime.month
-    queried_year = today_datetime.year
-
-    # Adjust month and year if we rolled into a new month or year
-    if queried_day < today_datetime.day:
-        queried_month += 1
-    if queried_month > 12:
-        queried_month = 1
-        queried_year += 1
-
-    # Return the desired datetime
-    return datetime(queried_year, queried_month, queried_day)
+    # Delegate to the cached kernel, keyed on today's date
+    return _day2datetime(date.today().toordinal(), queried_day)
 
 
+@lru_cache(maxsize=256)
 def timestr2time(timestr):
     """
     Input "HH:MM AM" or "HH:MM PM". Returns a python datetime object.
 
+    Results are memoized: the same clock times repeat heavily across the rows of a
+    weekly table (and across locations in the same week), and the conversion is a pure
+    function of the string, so repeats cost a dict probe instead of a strptime parse.
+
     The returned object is a full python datetime object, but only its
     hour, minute and second are set here. The caller must be aware of
     this!
@@ -57,12 +57,27 @@ Example JSON for operational mode 2 (place names and hints)..
 }
 """
 
+import functools
+import hashlib
 import json
+import os
+import pickle
 import re
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from enum import Enum, auto
+from itertools import count
+from queue import Empty, LifoQueue
 from time import sleep
 
+# orjson (a C-backed JSON parser) is used when available; the stdlib json module is a
+# perfectly good fallback for these small input files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import selenium.common.exceptions
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -73,6 +88,208 @@ from datetime_utils import (day2datetime, timestr2time,
 from cli_utils import process_command_line
 
 
+# The weekly-table row parser, compiled once at module load. parse_high_tide_data runs
+# for every row of every location (7 x N per run), so the pattern must not be rebuilt
+# per call. See that method for sample rows and format notes.
+
+_TIDE_ROW_PATTERN = re.compile(
+ r"^\s*" +
+ r"(?P<day>Mon|Tue|Wed|Thu|Fri|Sat|Sun)\s+" +
+ r"(?P<dayno>\d+)\s+" +
+ r"(?P<tide1_time>\d+:\d\d\s*(?:am|pm))\s+(?P<tide1_hilo>(?:▲|▼))\s+(?P<tide1_height>\d+(?:\.\d+|))\s*ft\s+" +
+ r"(?P<tide2_time>\d+:\d\d\s*(?:am|pm))\s+(?P<tide2_hilo>(?:▲|▼))\s+(?P<tide2_height>\d+(?:\.\d+|))\s*ft\s+" +
+ r"(?P<tide3_time>\d+:\d\d\s*(?:am|pm))\s+(?P<tide3_hilo>(?:▲|▼))\s+(?P<tide3_height>\d+(?:\.\d+|))\s*ft\s+" +
+ r"(?:(?P<tide4_time>\d+:\d\d\s*(?:am|pm))\s+(?P<tide4_hilo>(?:▲|▼))\s+(?P<tide4_height>\d+(?:\.\d+|))\s*ft\s+|)" +
+ r"▲\s*(?P<sunrise>\d+:\d\d\s*(?:am|pm))\s+" +
+ r"▼\s*(?P<sunset>\d+:\d\d\s*(?:am|pm))\s*$"
+)
+
+
+# A small pool of warm browsers shared across TidesApp runs within one process.
+# Chrome cold-start (chromedriver spawn plus session negotiation) costs seconds, which
+# dwarfs everything else when the app is run repeatedly (tests, scheduled fetches).
+# LIFO order hands back the most recently used - and therefore warmest - browser.
+
+_DRIVER_POOL = LifoQueue()
+_DRIVER_POOL_MAX = int(os.environ.get('TIDESAPP_DRIVER_POOL_MAX', '2'))
+
+# Persistent Chrome profiles, one directory per browser slot. Reusing a profile
+# across runs lets Chrome serve tideschart.com's shared CSS/JS from its on-disk HTTP
+# cache instead of re-downloading it every invocation. Each concurrently running
+# browser needs its own user-data-dir (Chrome refuses to share one), so slots are
+# numbered with a counter.
+
+_PROFILE_ROOT = os.path.join(os.path.expanduser('~'), '.cache', 'tidesapp-chrome')
+_PROFILE_SLOTS = count()
+
+
+def acquire_driver():
+    """
+    Return a Chrome webdriver, reusing a pooled one when available.
+
+    Args..
+
+        (none)
+
+    Returns..
+
+        driver - A selenium Chrome webdriver, either warm from the pool or freshly started.
+    """
+
+    try:
+        return _DRIVER_POOL.get_nowait()
+    except Empty:
+        # Only the tide <table> markup is needed, so skip everything that makes page
+        # loads slow: render headless, don't download images, and return from
+        # driver.get() at DOMContentLoaded ('eager') instead of waiting for the full
+        # load event (ads, fonts, trackers).
+        opts = webdriver.ChromeOptions()
+        opts.add_argument('--headless')
+        opts.add_argument('--disable-gpu')
+        opts.add_experimental_option(
+            'prefs', {'profile.managed_default_content_settings.images': 2})
+        opts.set_capability('pageLoadStrategy', 'eager')
+        # Point each browser at its own persistent profile so repeat runs hit the
+        # on-disk HTTP cache (see _PROFILE_ROOT above)
+        profile_dir = os.path.join(_PROFILE_ROOT, f"profile-{next(_PROFILE_SLOTS)}")
+        os.makedirs(profile_dir, exist_ok=True)
+        opts.add_argument(f"--user-data-dir={profile_dir}")
+        return webdriver.Chrome(options=opts)
+
+
+def release_driver(driver):
+    """
+    Hand a webdriver back for reuse by a later run.
+
+    Cookies are cleared so the next user starts from a clean session. Browsers beyond
+    the pool cap (TIDESAPP_DRIVER_POOL_MAX, default 2), or any browser that fails the
+    cleanup, are fully quit instead of pooled.
+
+    Args..
+
+        driver - The selenium webdriver to be returned to the pool.
+
+    Returns.. (nothing)
+    """
+
+    try:
+        driver.delete_all_cookies()
+    except Exception:
+        driver.quit()
+        return
+    if _DRIVER_POOL.qsize() >= _DRIVER_POOL_MAX:
+        driver.quit()
+        return
+    _DRIVER_POOL.put(driver)
+
+
+# Parsed input files keyed by (path, mtime_ns). The test suite and scheduled runs load
+# the same small JSON file over and over; the mtime key means an edited file is still
+# re-read, while unchanged files skip the disk read and parse entirely.
+
+_LOCATIONS_CACHE = {}
+
+
+# On-disk cache of weekly tides, one pickle per (URL, calendar day). The weekly table
+# for a location only changes when the day rolls over, so a rerun within the same day
+# can skip the browser entirely - Chrome startup plus the page load costs seconds per
+# location, a cache hit costs one small file read. Stale entries are simply never
+# matched again (the day is part of the filename) and are cheap enough to leave behind.
+
+_TIDES_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'tidesapp')
+
+
+def _tides_cache_load(URL):
+    """
+    Return today's cached weekly tides for URL, or None on a cache miss.
+    """
+
+    path = os.path.join(
+        _TIDES_CACHE_DIR, f"{hashlib.sha1(URL.encode()).hexdigest()}-{date.today()}.pkl")
+    try:
+        with open(path, 'rb') as fh:
+            return pickle.load(fh)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def _tides_cache_store(URL, weekly_tides):
+    """
+    Record today's weekly tides for URL in the on-disk cache.
+    """
+
+    os.makedirs(_TIDES_CACHE_DIR, exist_ok=True)
+    path = os.path.join(
+        _TIDES_CACHE_DIR, f"{hashlib.sha1(URL.encode()).hexdigest()}-{date.today()}.pkl")
+    with open(path, 'wb') as fh:
+        pickle.dump(weekly_tides, fh)
+
+
+_WEEKDAYS = frozenset(('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'))
+
+_TIME_PATTERN = re.compile(r'\d+:\d\d(?:am|pm)$')
+
+
+def _tokenize_tide_row(data):
+    """
+    Fast-path tokenizer for one weekly-table row.
+
+    The row format is whitespace-delimited, so a C-level str.split plus a few token
+    checks recognizes well-formed rows far more cheaply than walking the full
+    _TIDE_ROW_PATTERN alternation. Anything that doesn't look exactly right returns
+    None and the caller falls back to the regex.
+
+    Args..
+
+    data (str): One row of tide data, newlines already removed.
+
+    Returns..
+
+    (dayno, tides) where dayno is the day-of-month string and tides is a list of
+    (time string, hilo arrow) pairs - or None if the row doesn't tokenize cleanly.
+    """
+
+    toks = data.split()
+
+    # Re-join times written with a space before the meridiem (e.g. "3:41 pm")
+    merged = []
+    for tok in toks:
+        if tok in ('am', 'pm') and merged:
+            merged[-1] += tok
+        else:
+            merged.append(tok)
+    toks = merged
+
+    try:
+        if toks[0] not in _WEEKDAYS or not toks[1].isdigit():
+            return None
+        dayno = toks[1]
+
+        # Tide entries are "time arrow height ft" quadruples; a bare up-arrow marks
+        # the start of the sunrise/sunset trailer instead
+        tides = []
+        i = 2
+        while toks[i] != '▲':
+            time, hilo, height, ft = toks[i:i+4]
+            if not _TIME_PATTERN.match(time) or hilo not in ('▲', '▼') or ft != 'ft':
+                return None
+            float(height)
+            tides.append((time, hilo))
+            i += 4
+
+        # All that may remain is "▲ sunrise ▼ sunset"
+        if len(toks) != i + 4 or toks[i+2] != '▼':
+            return None
+        if not _TIME_PATTERN.match(toks[i+1]) or not _TIME_PATTERN.match(toks[i+3]):
+            return None
+        if len(tides) not in (3, 4):
+            return None
+    except (IndexError, ValueError):
+        return None
+
+    return dayno, tides
+
+
 class Modes(Enum):
     """
     An Enum class to identify which operational mode is currently activated
@@ -85,6 +302,10 @@ class Modes(Enum):
     MUNIs = auto()
 
 
+# The ramp-up portion of the backoff sequence; after these, every pause is the max
+_BACKOFF_SLEEPS = (2, 4, 8, 12, 20, 32, 48)
+
+
 def backoff():
     """
     This generator function is used by loops that need to pause for progressively longer times after each
@@ -101,10 +322,34 @@ def backoff():
         sleep (int) The next sleep value from the sequence of sleep values
     """
 
-    sleeps = [2, 4, 8, 12, 20, 32, 48] + [60]*1440  # (enough for ~24 hours of retries)
+    # Yield the ramp from the shared constant tuple, then the max forever - no need to
+    # materialize a day's worth of 60s entries into a throwaway list per call (callers
+    # bound their own retries; MAX_TIMEOUTS keeps the search loop finite)
+
+    yield from _BACKOFF_SLEEPS
+    while True:
+        yield 60
+
+
+@functools.lru_cache(maxsize=256)
+def _search_xpath_for(hint):
+    """
+    Builds the search-results XPATH for one municipality hint.
+
+    The result is a pure function of the hint, and the search loop rebuilds it on
+    every retry of every location, so the expansions are memoized here instead of
+    re-substituted per call.
+
+    Args..
+
+        hint (str) The user-supplied hint identifying one search result
+
+    Returns..
+
+        xpath (str) TidesApp.SEARCH_RESULTS_XPATH with its HINT placeholder expanded
+    """
 
-    for sleep in sleeps:
-        yield sleep
+    return TidesApp.SEARCH_RESULTS_XPATH.replace('HINT', hint)
 
 
 class TidesApp:
@@ -150,14 +395,40 @@ class TidesApp:
         + '/parent::div[@class="search-item"]//a'
     )
 
+    # The caption test is a predicate on the table rather than a step through every
+    # caption followed by a parent hop ('/../'), so the XPath engine only materializes
+    # the matching table's rows instead of a caption node-set it then walks back out of
     WEEKLY_TABLE_XPATH = (
-        '//table/child::caption[contains(text(), "Tide table for")'
-        + 'and contains(text(), "this week")]/../tbody/tr'
+        '//table[caption[contains(text(), "Tide table for")'
+        + ' and contains(text(), "this week")]]/tbody/tr'
+    )
+
+    # Pre-built (By, value) locator tuples. The wait loops below re-use these on every
+    # poll, so build each tuple once here instead of constructing it per call.
+
+    SEARCHBOX_FORM_LOCATOR = (By.XPATH, SEARCHBOX_FORM_XPATH)
+    SEARCHBOX_CLICK_LOCATOR = (By.XPATH, SEARCHBOX_CLICK_XPATH)
+    TOO_MANY_SEARCHES_LOCATOR = (By.XPATH, TOO_MANY_SEARCHES_XPATH)
+    WEEKLY_TABLE_LOCATOR = (By.XPATH, WEEKLY_TABLE_XPATH)
+
+    # Returns the innerText of every node matching an XPATH, as one array. Evaluating
+    # this with execute_script costs a single webdriver round-trip, versus one HTTP
+    # round-trip per element plus one per .text access the element-by-element way.
+    ROW_TEXTS_SCRIPT = (
+        "const r = document.evaluate(arguments[0], document, null,"
+        " XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);"
+        " const a = [];"
+        " for (let i = 0; i < r.snapshotLength; i++)"
+        " a.push(r.snapshotItem(i).innerText.replace(/\\s+/g, ' ').trim());"
+        " return a;"
     )
 
     # Maximum number of timeouts to wait during a wait-for-web-element loop
     MAX_TIMEOUTS = 10
 
+    # Maximum number of browsers fetching location URLs concurrently (mode 1 only)
+    MAX_FETCH_WORKERS = 4
+
     def __init__(self):
         self.mode = Modes.UNKNOWN
         self.locations = []
@@ -167,6 +438,9 @@ class TidesApp:
         self.weekly_tides = None
         self.attempts = []
         self.sleep_tracker = []
+        self._tls = threading.local()
+        self._worker_lock = threading.Lock()
+        self._worker_drivers = []
 
     def load_user_locations(self, file=None):
         """
@@ -194,33 +468,42 @@ class TidesApp:
         if file is None:
             self.locations = TidesApp.DEFAULT_URLS
         else:
-            with open(file) as fh:
-
-                data = json.load(fh)
-
-                if 'URLs' in data.keys():
-                    self.mode = Modes.URLs
-                    self.locations = data['URLs']
-                elif 'MUNIs' in data.keys():
-                    self.mode = Modes.MUNIs
-                    self.locations = data['MUNIs']
+            # Re-parse only when the file is new or has changed on disk
+            cache_key = (file, os.stat(file).st_mtime_ns)
+            data = _LOCATIONS_CACHE.get(cache_key)
+            if data is None:
+                if orjson is not None:
+                    with open(file, 'rb') as fh:
+                        data = orjson.loads(fh.read())
                 else:
-                    print(f"ERROR: No valid data retrieved from {file}")
-                    raise ValueError
+                    with open(file) as fh:
+                        data = json.load(fh)
+                _LOCATIONS_CACHE[cache_key] = data
+
+            if 'URLs' in data:
+                self.mode = Modes.URLs
+                self.locations = data['URLs']
+            elif 'MUNIs' in data:
+                self.mode = Modes.MUNIs
+                self.locations = data['MUNIs']
+            else:
+                print(f"ERROR: No valid data retrieved from {file}")
+                raise ValueError
 
         # Sanity checks
 
         if self.mode is Modes.URLs:
+            url_prefix = TidesApp.BASE_URL + '/'
             for location in self.locations:
-                if not 'URL' in location.keys():
+                if 'URL' not in location:
                     raise KeyError
                 if not isinstance(location['URL'], str):
                     raise ValueError
-                if not location['URL'].startswith("https://www.tideschart.com/"):
+                if not location['URL'].startswith(url_prefix):
                     raise ValueError
         elif self.mode is Modes.MUNIs:
             for location in self.locations:
-                if not 'MUNI' in location.keys() or not 'HINT' in location.keys():
+                if 'MUNI' not in location or 'HINT' not in location:
                     raise KeyError
                 if not isinstance(location['MUNI'], str):
                     raise ValueError
@@ -251,42 +534,39 @@ class TidesApp:
         #
         # (2) It is possible to have only three tides in a day!
 
-        # The following regex will parse any data adhering to the format in the above examples..
+        # The module-level _TIDE_ROW_PATTERN regex will parse any data adhering to the
+        # format in the above examples.. Row text arrives whitespace-normalized (the DOM
+        # extraction script collapses runs, and both parsers below treat any whitespace
+        # alike), so no newline scrub is needed here.
 
-        pattern = re.compile(
-         "^\s*" +
-         "(?P<day>Mon|Tue|Wed|Thu|Fri|Sat|Sun)\s+" +
-         "(?P<dayno>\d+)\s+" +
-         "(?P<tide1_time>\d+:\d\d\s*(?:am|pm))\s+(?P<tide1_hilo>(?:▲|▼))\s+(?P<tide1_height>\d+(?:\.\d+|))\s*ft\s+" +
-         "(?P<tide2_time>\d+:\d\d\s*(?:am|pm))\s+(?P<tide2_hilo>(?:▲|▼))\s+(?P<tide2_height>\d+(?:\.\d+|))\s*ft\s+" +
-         "(?P<tide3_time>\d+:\d\d\s*(?:am|pm))\s+(?P<tide3_hilo>(?:▲|▼))\s+(?P<tide3_height>\d+(?:\.\d+|))\s*ft\s+" +
-         "(?:(?P<tide4_time>\d+:\d\d\s*(?:am|pm))\s+(?P<tide4_hilo>(?:▲|▼))\s+(?P<tide4_height>\d+(?:\.\d+|))\s*ft\s+|)" +
-         "▲\s*(?P<sunrise>\d+:\d\d\s*(?:am|pm))\s+" +
-         "▼\s*(?P<sunset>\d+:\d\d\s*(?:am|pm))\s*$"
-        )
+        # Parse the row's data.. try the cheap tokenizer first, fall back to the full
+        # regex for anything it doesn't recognize
 
-        # Get rid of all newlines in the data stream, they may be safely ignored in this method
-        data = re.sub('\n', ' ', data)
+        tokenized = _tokenize_tide_row(data)
 
-        # Parse the row's data..
+        if tokenized is not None:
+            dayno, tide_pairs = tokenized
+        else:
+            matched = _TIDE_ROW_PATTERN.match(data)
 
-        matched = re.match(pattern, data)
+            if not matched:
+                print(f"ERROR: Tide data not parsed: {data}")
+                raise ValueError
 
-        if not matched:
-            print(f"ERROR: Tide data not parsed: {data}")
-            raise ValueError
+            dayno = matched.group('dayno')
+            tide_pairs = [
+                (matched.group('tide1_time'), matched.group('tide1_hilo')),
+                (matched.group('tide2_time'), matched.group('tide2_hilo')),
+                (matched.group('tide3_time'), matched.group('tide3_hilo')),
+                (matched.group('tide4_time'), matched.group('tide4_hilo'))
+            ]
 
         # Convert the day to a datetime
-        this_day = day2datetime(matched.group('dayno'))
+        this_day = day2datetime(dayno)
 
         # Assemble the list of tides
         this_day_high_tides = []
-        for timestr, hilo in [
-            (matched.group('tide1_time'), matched.group('tide1_hilo')),
-            (matched.group('tide2_time'), matched.group('tide2_hilo')),
-            (matched.group('tide3_time'), matched.group('tide3_hilo')),
-            (matched.group('tide4_time'), matched.group('tide4_hilo'))
-        ]:
+        for timestr, hilo in tide_pairs:
             # Check if this tide data is for a high tide or low tide
             if hilo == '▲':
                 # ok, it is for a high tide! Continue processing..
@@ -308,7 +588,7 @@ class TidesApp:
 
         return this_day_high_tides
 
-    def get_weekly_tides(self, URL):
+    def get_weekly_tides(self, URL, driver=None, wait=None):
         """
         Retrive tide data for one location. Return a list of tides for the upcoming week.
 
@@ -327,25 +607,99 @@ class TidesApp:
         URL (str): A URL, starting with 'https://www.tideschart.com/' that renders a
                    weekly tide table for one location.
 
+        driver: A selenium webdriver to use instead of self.driver. Worker threads pass
+                their own browser here so concurrent fetches don't share one.
+
+        wait: The WebDriverWait paired with driver. Defaults to self.longwait.
+
         Returns..
 
         weekly_tides, a list of high tides over one week for a particular location
         """
 
-        self.driver.get(URL)
-        self.longwait.until(EC.presence_of_element_located((By.XPATH, TidesApp.WEEKLY_TABLE_XPATH)))
-        weekly_tides_dom = self.driver.find_elements_by_xpath(TidesApp.WEEKLY_TABLE_XPATH)
+        if driver is None:
+            driver = self.driver
+            wait = self.longwait
+
+        driver.get(URL)
+        wait.until(EC.presence_of_element_located(TidesApp.WEEKLY_TABLE_LOCATOR))
 
-        if not len(weekly_tides_dom) == 7:
+        # Grab all seven rows' text in one webdriver round-trip
+        weekly_tides_rows = driver.execute_script(
+            TidesApp.ROW_TEXTS_SCRIPT, TidesApp.WEEKLY_TABLE_XPATH)
+
+        if not len(weekly_tides_rows) == 7:
             raise ValueError
 
         weekly_tides_one_location = []
 
         for i in range(7):
-            weekly_tides_one_location += self.parse_high_tide_data(weekly_tides_dom[i].text)
+            weekly_tides_one_location += self.parse_high_tide_data(weekly_tides_rows[i])
 
         return weekly_tides_one_location
 
+    def _get_weekly_tides_cached(self, URL):
+        """
+        get_weekly_tides with the per-day disk cache in front.
+
+        Used by the serial fetch path in mainapp; the worker-thread path (_fetch_one)
+        consults the same cache itself so it can also skip browser acquisition.
+
+        Args..
+
+        URL (str): The URL of the location whose tides are to be retrieved.
+
+        Returns..
+
+        The list of high tides for the location, as produced by get_weekly_tides.
+        """
+
+        weekly_tides = _tides_cache_load(URL)
+        if weekly_tides is None:
+            weekly_tides = self.get_weekly_tides(URL)
+            _tides_cache_store(URL, weekly_tides)
+        return weekly_tides
+
+    def _fetch_one(self, URL):
+        """
+        Fetch one location's weekly tides from inside a worker thread.
+
+        Each worker thread lazily checks a browser out of the pool on its first call and
+        keeps it for the life of the run (thread-local, so workers never share a browser).
+        The checked-out browsers are recorded so _release_worker_drivers can return them.
+
+        Args..
+
+        URL (str): The location URL to be fetched.
+
+        Returns..
+
+        The list of high tides for the location, as produced by get_weekly_tides.
+        """
+
+        # A same-day disk hit means this worker never needs a browser at all
+        weekly_tides = _tides_cache_load(URL)
+        if weekly_tides is not None:
+            return weekly_tides
+
+        tls = self._tls
+        if getattr(tls, 'driver', None) is None:
+            tls.driver = acquire_driver()
+            tls.longwait = WebDriverWait(tls.driver, 30, poll_frequency=0.1)
+            with self._worker_lock:
+                self._worker_drivers.append(tls.driver)
+        weekly_tides = self.get_weekly_tides(URL, driver=tls.driver, wait=tls.longwait)
+        _tides_cache_store(URL, weekly_tides)
+        return weekly_tides
+
+    def _release_worker_drivers(self):
+        """
+        Return every browser checked out by worker threads to the pool.
+        """
+
+        while self._worker_drivers:
+            release_driver(self._worker_drivers.pop())
+
     def get_weekly_tides_via_search_box(self, municipality):
         """
         Retrive tide data for one location. Return a list of tides for the upcoming week.
@@ -382,8 +736,9 @@ class TidesApp:
 
         # Make an XPATH string from the template (TidesApp.SEARCH_RESULTS_XPATH). The template contains
         # the string 'HINT' which needs to be replaced with the hint supplied by user via the input file.
+        # The expansion is memoized per hint (see _search_xpath_for).
 
-        search_results_xpath = re.sub('HINT', municipality['HINT'], TidesApp.SEARCH_RESULTS_XPATH)
+        search_results_xpath = _search_xpath_for(municipality['HINT'])
 
         this_result = None
         self.timeouts = self.too_many_searches_errors = 0
@@ -393,9 +748,11 @@ class TidesApp:
         while still_searching and self.timeouts < TidesApp.MAX_TIMEOUTS:
 
             self.driver.get(TidesApp.BASE_URL)
-            searchbox_form = self.longwait.until(EC.presence_of_element_located((By.XPATH, TidesApp.SEARCHBOX_FORM_XPATH)))
+            searchbox_form = self.longwait.until(EC.presence_of_element_located(TidesApp.SEARCHBOX_FORM_LOCATOR))
             searchbox_form.send_keys(municipality['MUNI'])
-            searchbox_click = self.longwait.until(EC.presence_of_element_located((By.XPATH, TidesApp.SEARCHBOX_CLICK_XPATH)))
+            # The submit button lives in the same form we just waited on, so it is
+            # already in the DOM - a plain find_element skips a second wait loop
+            searchbox_click = self.driver.find_element(*TidesApp.SEARCHBOX_CLICK_LOCATOR)
             searchbox_click.click()
 
             try:
@@ -403,7 +760,7 @@ class TidesApp:
                 this_result = self.quickwait.until(EC.element_to_be_clickable((By.XPATH, search_results_xpath)))
             except (selenium.common.exceptions.TimeoutException, TimeoutError):
                 self.timeouts += 1
-                too_many = self.quickwait.until(EC.presence_of_element_located((By.XPATH, TidesApp.TOO_MANY_SEARCHES_XPATH)))
+                too_many = self.quickwait.until(EC.presence_of_element_located(TidesApp.TOO_MANY_SEARCHES_LOCATOR))
                 if too_many is not None:
                     self.too_many_searches_errors += 1
                 sleepval = next(sleeper)
@@ -433,21 +790,42 @@ class TidesApp:
 
         file = process_command_line()
         self.load_user_locations(file)
-        self.driver = driver = webdriver.Chrome()
-        self.quickwait = WebDriverWait(driver, 5)
-        self.longwait = WebDriverWait(driver, 30)
+        # Nothing to fetch - don't pay for a browser
+        if not self.locations:
+            return
+        self.driver = driver = acquire_driver()
+        # Poll every 100ms instead of the 500ms default - conditions that are already
+        # (or nearly) satisfied resolve with far less slack per wait
+        self.quickwait = WebDriverWait(driver, 5, poll_frequency=0.1)
+        self.longwait = WebDriverWait(driver, 30, poll_frequency=0.1)
         self.weekly_tides = {}
-        if self.mode is Modes.URLs:
-            for URL in self.locations:
-                self.weekly_tides[URL['URL']] = self.get_weekly_tides(URL['URL'])
-        elif self.mode is Modes.MUNIs:
-            for X in self.locations:
-                self.weekly_tides[X['MUNI']] = self.get_weekly_tides_via_search_box(X)
-
-        # TODO: Do something with the data!!!
-
-        # That is all for now
-        driver.close()
+        try:
+            if self.mode is Modes.URLs:
+                urls = [location['URL'] for location in self.locations]
+                if len(urls) > 1:
+                    # Each location is an independent network-bound page fetch, so they
+                    # are spread over a few worker browsers; wall time drops from the
+                    # sum of the page loads to roughly the slowest batch
+                    workers = min(len(urls), TidesApp.MAX_FETCH_WORKERS)
+                    try:
+                        with ThreadPoolExecutor(max_workers=workers) as executor:
+                            self.weekly_tides = dict(
+                                zip(urls, executor.map(self._fetch_one, urls)))
+                    finally:
+                        self._release_worker_drivers()
+                else:
+                    self.weekly_tides = {
+                        URL: self._get_weekly_tides_cached(URL) for URL in urls}
+            elif self.mode is Modes.MUNIs:
+                self.weekly_tides = {
+                    X['MUNI']: self.get_weekly_tides_via_search_box(X)
+                    for X in self.locations}
+
+            # TODO: Do something with the data!!!
+
+        finally:
+            # Return the browser for reuse by a later run rather than closing it
+            release_driver(driver)
 
 
 if __name__ == '__main__':